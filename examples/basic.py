@@ -7,8 +7,10 @@
 
 """
 import logging
+import struct
 import time
 from datetime import date
+from typing import Union
 
 from pynanomodem import (
     EventNotification,
@@ -44,6 +46,11 @@ logger.handlers.clear()
 logger.addHandler(file_handler)
 logger.addHandler(console)
 
+# SIN, timestamp, latitude, longitude, signal quality, SNR
+_HEARTBEAT = struct.Struct('>BIiiBB')
+# SIN, requested interval
+_MT_HDR = struct.Struct('>BI')
+
 
 def build_heartbeat(modem: SatelliteModem) -> bytes:
     """Builds a heartbeat payload for a Mobile-Originated message.
@@ -64,33 +71,33 @@ def build_heartbeat(modem: SatelliteModem) -> bytes:
     lon_enc = int(loc.longitude * 60000)
     sq = modem.get_signal_quality().value
     snr_enc = int(round(modem.get_snr(), 0))
-    payload = bytearray(sin_byte.to_bytes(1, 'big'))
-    payload.extend(ts.to_bytes(4, 'big'))   # could use 31 bits
-    payload.extend(lat_enc.to_bytes(4, 'big', signed=True))   # could use 25 bits or fewer with less resolution than 1.5m
-    payload.extend(lon_enc.to_bytes(4, 'big', signed=True))   # could use 24 bits or fewer with less resolution than 1.5m
-    payload.extend(sq.to_bytes(1, 'big'))   # could use 3 bits
-    payload.extend(snr_enc.to_bytes(1, 'big'))   # could use 5 bits with offset and effective range 32-50
-    return bytes(payload)
+    # ts could use 31 bits
+    # lat/lon could use 25/24 bits or fewer with less resolution than 1.5m
+    # sq could use 3 bits
+    # snr could use 5 bits with offset and effective range 32-50
+    return _HEARTBEAT.pack(sin_byte, ts & 0xFFFFFFFF, lat_enc, lon_enc, sq, snr_enc)
 
 
-def reconfigure_hearbeat(payload: bytes, old_interval: int = HEARTBEAT_INTERVAL) -> int:
+def reconfigure_hearbeat(payload: Union[bytes, memoryview],
+                         old_interval: int = HEARTBEAT_INTERVAL) -> int:
     """Parses a MT message payload to change the heartbeat interval.
     
     Expects:
     SIN 255
     4 bytes uint_32 new interval with range 0..86400
     """
-    if isinstance(payload, bytes) and len(payload) > 2:
-        if payload[0] == 255:
-            request = int.from_bytes(payload[1:5], byteorder='big')
-            if request in range(1, 86401):
-                logger.info('Remote request changed heartbeat interval to %d s',
-                            request)
-                return request
-            else:
-                logger.warning('Unsupported interval %d', request)
-    else:
+    try:
+        sin, request = _MT_HDR.unpack_from(payload, 0)
+    except (struct.error, TypeError):
         logger.warning('Unknown MT message structure')
+        return old_interval
+    if sin == 255:
+        if request in range(1, 86401):
+            logger.info('Remote request changed heartbeat interval to %d s',
+                        request)
+            return request
+        else:
+            logger.warning('Unsupported interval %d', request)
     return old_interval
 
 
@@ -98,7 +105,9 @@ def main():
     heartbeat_interval = HEARTBEAT_INTERVAL
     modem = mutate_modem(SatelliteModem())
     modem.connect()
+    event_cls: type[EventNotification]
     if modem.network == NetworkProtocol.IDP:
+        event_cls = EventNotificationIdp
         modem.set_monitor_network_trace()
         events_mask = (EventNotificationIdp.NETWORK_REGISTERED |
                        EventNotificationIdp.MESSAGE_MO_COMPLETE |
@@ -106,6 +115,7 @@ def main():
                        EventNotificationIdp.WAKEUP_INTERVAL_CHANGE |
                        EventNotificationIdp.EVENT_TRACE_CACHED)
     else:
+        event_cls = EventNotificationOgx
         events_mask = (EventNotificationOgx.NETWORK_REGISTERED |
                        EventNotificationOgx.MESSAGE_MO_COMPLETE |
                        EventNotificationOgx.MESSAGE_MT_RECEIVED |
@@ -126,26 +136,33 @@ def main():
                                        EventNotificationIdp.MESSAGE_MT_RECEIVED]
     try:
         while True:
+            # drain all pending URCs, blocking only for the first
             urc = modem.get_urc()
-            if urc:
+            while urc:
                 try:
-                    event: EventNotification = modem.get_urc_event(urc)         # type: ignore
-                    events.append(event)
+                    urc_events = modem.get_urc_events(urc)
+                except NotImplementedError:
+                    urc_events = []
+                for event in urc_events:
                     logger.info('URC signalled event: %s', event.name)
-                except AttributeError:
-                    pass
+                events.extend(urc_events)
+                urc = modem.get_urc(timeout=0)
+            # coalesce repeated events to avoid redundant queue queries
+            events = list(dict.fromkeys(events))
             
-            if not events and time.time() - last_notification_check_time >= 5:
+            now = time.time()
+            if not events and now - last_notification_check_time >= 5:
                 events_mask = modem.get_active_events_mask()
-                events = EventNotification.get_events(events_mask)
-                last_notification_check_time = time.time()
+                events = event_cls.get_events(events_mask)
+                last_notification_check_time = now
             
-            if time.time() - last_log_time >= log_interval:
-                logger.info('%s', modem.get_netinfo())
-                last_log_time = time.time()
+            if now - last_log_time >= log_interval:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info('%s', modem.get_netinfo())
+                last_log_time = now
             
             if (heartbeat_interval and
-                time.time() - last_heartbeat_time >= heartbeat_interval):
+                now - last_heartbeat_time >= heartbeat_interval):
                 # send heartbeat
                 heartbeat_count += 1
                 logger.info('Heartbeat # %d triggered', heartbeat_count)
@@ -157,7 +174,7 @@ def main():
                 else:
                     logger.warning('Cannot transmit - skipping heartbeat %d',
                                    heartbeat_count)
-                last_heartbeat_time = time.time()
+                last_heartbeat_time = now
                 logger.info('Next heartbeat in %0.1f hours',
                             heartbeat_interval / 3600)
                 
@@ -165,8 +182,7 @@ def main():
                 
                 if event.is_mt_recv():
                     rx_queue = modem.get_mt_message_queue()
-                    for i, _ in enumerate(rx_queue):
-                        mt_message = rx_queue[i]
+                    for mt_message in rx_queue:
                         mt_message = modem.mt_message_recv(mt_message)
                         if (mt_message and
                             mt_message.size and
@@ -183,7 +199,7 @@ def main():
                 
                 elif event.is_mo_complete():
                     tx_queue = modem.get_mo_message_queue()
-                    for i, mo_message in enumerate(tx_queue):
+                    for mo_message in tx_queue:
                         if (mo_message.state and
                             mo_message.state.is_complete() and
                             mo_message.id):
@@ -191,7 +207,7 @@ def main():
                                         mo_message.id, mo_message.state.name)
                             modem.mo_message_delete(mo_message.id)
                 
-                else:
+                elif logger.isEnabledFor(logging.DEBUG):
                     logger.debug('Ignoring %s', event.name)
             
             if events:
@@ -46,32 +46,62 @@ def iter_chunks_with_header(data: bytearray, chunk_size: int) -> Iterable[bytes]
     First 2 bytes are 0xFFFF as an identifier for large message.
     3rd byte is the subsequent number of chunks to be transmitted.
     """
-    header_sin_min = b'\xFF\xFF'
+    header_size = 3
     chunks_left = math.ceil(len(data) / chunk_size)
     if chunks_left > 255:
         raise ValueError('Exceeded maximum chunk count')
+    view = memoryview(data)
     for i in range(0, len(data), chunk_size):
         chunks_left -= 1
-        yield bytes(header_sin_min + bytes([chunks_left]) + data[i:i + chunk_size])
+        n = min(chunk_size, len(data) - i)
+        buf = bytearray(header_size + n)
+        buf[0:2] = b'\xFF\xFF'
+        buf[2] = chunks_left
+        buf[header_size:] = view[i:i + n]
+        yield bytes(buf)
+
+
+def wait_for_urc_or_timeout(modem: SatelliteModem,
+                            timeout: float,
+                            ) -> list[EventNotification]:
+    """Block until the modem emits URC events or the timeout expires.
+    
+    The AT client listener thread owns the serial port and queues unsolicited
+    results, so waiting on that queue wakes as soon as a URC arrives rather
+    than on a fixed polling tick.
+    """
+    deadline = time.time() + timeout
+    remaining = timeout
+    while remaining > 0:
+        urc = modem.get_urc(timeout=remaining)
+        if urc:
+            try:
+                events = modem.get_urc_events(urc)
+                if events:
+                    return events
+            except NotImplementedError:
+                pass
+        remaining = deadline - time.time()
+    return []
 
 
 def main():
     modem = mutate_modem(SatelliteModem())
     modem.connect()
+    event_cls: type[EventNotification]
     if modem.network == NetworkProtocol.IDP:
-        events_mask = int(EventNotificationIdp.MESSAGE_MO_COMPLETE)
+        event_cls = EventNotificationIdp
     else:
-        events_mask = int(EventNotificationOgx.MESSAGE_MO_COMPLETE)
+        event_cls = EventNotificationOgx
+    events_mask = int(event_cls.MESSAGE_MO_COMPLETE)
     events_set = modem.set_event_mask(events_mask)
     if not events_set:
         logger.error('Unable to set events notifications')
-    events = []
+    events: list[EventNotification] = []
     logger.info('Starting large message test using %s on %s network',
                 modem.mobile_id, modem.network.name)
     last_notification_check_time = 0
-    data = bytearray()
-    for i in range(FILE_SIZE):
-        data.extend([255 if i % 2 == 0 else 0])
+    data = bytearray(b'\xff\x00' * ((FILE_SIZE + 1) // 2))[:FILE_SIZE]
     chunk_size = 6144 if modem.network == NetworkProtocol.IDP else 15360
     chunk_count = 0
     if modem.is_transmit_allowed():
@@ -83,22 +113,24 @@ def main():
             msg_meta = modem.mo_message_send(chunk)
             submit_time = time.time()
             while msg_meta:
-                if not events and time.time() - last_notification_check_time >= 5:
+                wait = max(0, 5 - (time.time() - last_notification_check_time))
+                events = wait_for_urc_or_timeout(modem, wait)
+                now = time.time()
+                if not events and now - last_notification_check_time >= 5:
                     events_mask = modem.get_active_events_mask()
-                    events = EventNotification.get_events(events_mask)
-                    last_notification_check_time = time.time()
-                    if any(event.is_mo_complete() for event in events):
-                        tx_queue = modem.get_mo_message_queue()
-                        for msg in tx_queue:
-                            if msg.id == msg_meta.id:
-                                latency = time.time() - submit_time
-                                logger.info('Chunk %d completed in %0.1fs',
-                                            chunk_count, latency)
-                                modem.mo_message_delete(msg_meta.id)            # type: ignore
-                                msg_meta = None
-                                break
+                    events = event_cls.get_events(events_mask)
+                    last_notification_check_time = now
+                if any(event.is_mo_complete() for event in events):
+                    tx_queue = modem.get_mo_message_queue()
+                    for msg in tx_queue:
+                        if msg.id == msg_meta.id:
+                            latency = now - submit_time
+                            logger.info('Chunk %d completed in %0.1fs',
+                                        chunk_count, latency)
+                            modem.mo_message_delete(msg_meta.id)                # type: ignore
+                            msg_meta = None
+                            break
                 events = []
-                time.sleep(1)
         total_latency = time.time() - start_time
         logger.info('%d-bytes data transmitted in %0.1fs (%d chunks)',
                     len(data), total_latency, chunk_count)
@@ -395,13 +395,20 @@ class PowerMode(IntEnum):
     MOBILE_PARKED = 5
 
 
+# cache: {EventNotification subclass: ((bit, member), ...)}
+_event_bits: 'dict[type, tuple[tuple[int, EventNotification], ...]]' = {}
+
+
 class EventNotification(IntFlag):
     """Bitmask enumerated values for modem event notifications."""
     
     @classmethod
     def get_events(cls, event_mask: int) -> 'list[EventNotification]':
         """Parses a bitmask to return a list of events."""
-        return [item for item in cls if item.value & event_mask]
+        bits = _event_bits.get(cls)
+        if bits is None:
+            bits = _event_bits[cls] = tuple((item.value, item) for item in cls)
+        return [item for value, item in bits if value & event_mask]
     
     @classmethod
     def get_bitmask(cls, events: 'list[EventNotification]') -> int:
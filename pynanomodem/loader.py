@@ -8,7 +8,7 @@ import os
 import tempfile
 import shutil
 import subprocess
-from typing import Type
+from typing import Optional, Type
 from pathlib import Path
 
 from . import modems
@@ -29,6 +29,10 @@ GITHUB_REPOS = [
 
 # cache: {Path: loaded_module}
 _module_cache: dict[Path, object] = {}
+# cache: {serial_port: detected_model}
+_model_cache: dict[str, ModemModel] = {}
+# cache: {(modems_path, model): subclass}
+_class_cache: dict[tuple[Path, ModemModel], Type[SatelliteModem]] = {}
 
 
 def load_module_from_path(module_path: Path):
@@ -48,6 +52,30 @@ def load_module_from_path(module_path: Path):
     return module
 
 
+def _find_modem_file(modems_path: Path, model: ModemModel) -> Optional[Path]:
+    """Find the Python file for a model in a folder of modem modules."""
+    file_tag = f'{model.name.lower()}.py'
+    return next(
+        (p for p in modems_path.glob('*.py') if p.name.endswith(file_tag)),
+        None,
+    )
+
+
+def _detect_model(modem: SatelliteModem, refresh: bool = False) -> ModemModel:
+    """Get the modem model, reusing a prior detection on the same port.
+    
+    The cached model is only valid while the port stays open, since a
+    different modem may be attached after a disconnect.
+    """
+    port = modem.port
+    if port and not refresh and port in _model_cache:
+        return _model_cache[port]
+    model = modem.get_model()
+    if port and model != ModemModel.UNKNOWN:
+        _model_cache[port] = model
+    return model
+
+
 def clone_and_load_modem_classes(repo_urls: list[str],
                                  branch: str = 'main',
                                  download_path: str = '',
@@ -122,6 +150,9 @@ def mutate_modem(modem: SatelliteModem, **kwargs) -> SatelliteModem:
         **module (module): The module containing the subclass python files.
             Downloaded files from GitHub will be stored here.
         **mixin (SatelliteModem): Optional mixin extension subclass to apply.
+        **refresh (bool): Query the model even if previously detected on the
+            same serial port. A modem that is not already connected is always
+            queried, in case a different modem was attached to the port.
     
     Returns:
         Subclass of SatelliteModem.
@@ -132,63 +163,62 @@ def mutate_modem(modem: SatelliteModem, **kwargs) -> SatelliteModem:
     was_connected = modem.is_connected()
     if not was_connected:
         modem.connect()
-    model = modem.get_model()
+    refresh = kwargs.pop('refresh', False) or not was_connected
+    model = _detect_model(modem, refresh)
     if model == ModemModel.UNKNOWN:
         raise ModuleNotFoundError('Unrecognized modem')
     if model == modem._model:
         return modem
     pymodule = kwargs.pop('module', modems)
     modems_path = Path(pymodule.__path__[0])
-    file_tag = f'{model.name.lower()}.py'
-    modem_path = next(
-        (p for p in modems_path.glob('*.py') if p.name.endswith(file_tag)),
-        None,
-    )
-    if modem_path is None:
-        try:
-            token = kwargs.get('github_token', GITHUB_TOKEN)
-            if token:
-                _log.debug('Attempting to clone model-specific subclass...')
-                org = kwargs.get('github_org_name', GITHUB_ORG)
-                repos: list[str] = kwargs.get('github_repos', GITHUB_REPOS)
-                for repo_name in repos:
-                    if repo_name.replace('-', '_').endswith(model.name.lower()):
-                        _log.info('Copying %s from GitHub to %s',
-                                    model.name, modems_path)
-                        repo_url = (f'https://{token}@github.com'
-                                    f'/{org}/pynanomodem-{repo_name}')
-                        clone_and_load_modem_classes(
-                            [repo_url], download_path=str(modems_path)
-                        )
-                        break
-                # refresh after download
-                modem_path = next(
-                    (p for p in modems_path.glob('*.py') if p.name.endswith(file_tag)),
-                    None,
-                )
-        except Exception as e:
-            raise ModuleNotFoundError(f'No module for {model.name}') from e
-    # Check if download still did not get the target file
-    if modem_path is None:
-        raise ModuleNotFoundError(f'No Python file found for {model.name}')
-    submodule = load_module_from_path(modem_path)
-    for _, candidate in inspect.getmembers(submodule, inspect.isclass):
-        if issubclass(candidate, SatelliteModem):
-            if getattr(candidate, '_model', None) == model:
-                # Disconnect for state prior to mutation
-                if not was_connected:
-                    modem.disconnect()
-                mixin = kwargs.get('mixin')
-                if mixin and issubclass(mixin, SatelliteModem):
-                    Extended = type(
-                        f'Extended{candidate.__name__}',
-                        (candidate, mixin),
-                        {}
-                    )
-                    modem.__class__ = Extended
-                else:
-                    modem.__class__ = candidate
-                modem._post_mutate()
-                return modem
-    # Fall-through
-    raise ModuleNotFoundError(f'No subclass found for {model.name}')
+    cache_key = (modems_path, model)
+    candidate = _class_cache.get(cache_key)
+    if candidate is None:
+        modem_path = _find_modem_file(modems_path, model)
+        if modem_path is None:
+            try:
+                token = kwargs.get('github_token', GITHUB_TOKEN)
+                if token:
+                    _log.debug('Attempting to clone model-specific subclass...')
+                    org = kwargs.get('github_org_name', GITHUB_ORG)
+                    repos: list[str] = kwargs.get('github_repos', GITHUB_REPOS)
+                    for repo_name in repos:
+                        if repo_name.replace('-', '_').endswith(model.name.lower()):
+                            _log.info('Copying %s from GitHub to %s',
+                                        model.name, modems_path)
+                            repo_url = (f'https://{token}@github.com'
+                                        f'/{org}/pynanomodem-{repo_name}')
+                            clone_and_load_modem_classes(
+                                [repo_url], download_path=str(modems_path)
+                            )
+                            break
+                    # refresh after download
+                    modem_path = _find_modem_file(modems_path, model)
+            except Exception as e:
+                raise ModuleNotFoundError(f'No module for {model.name}') from e
+        # Check if download still did not get the target file
+        if modem_path is None:
+            raise ModuleNotFoundError(f'No Python file found for {model.name}')
+        submodule = load_module_from_path(modem_path)
+        for _, cls in inspect.getmembers(submodule, inspect.isclass):
+            if (issubclass(cls, SatelliteModem) and
+                getattr(cls, '_model', None) == model):
+                candidate = _class_cache[cache_key] = cls
+                break
+        else:
+            raise ModuleNotFoundError(f'No subclass found for {model.name}')
+    # Disconnect for state prior to mutation
+    if not was_connected:
+        modem.disconnect()
+    mixin = kwargs.get('mixin')
+    if mixin and issubclass(mixin, SatelliteModem):
+        Extended = type(
+            f'Extended{candidate.__name__}',
+            (candidate, mixin),
+            {}
+        )
+        modem.__class__ = Extended
+    else:
+        modem.__class__ = candidate
+    modem._post_mutate()
+    return modem
@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Union, Optional
+from unittest.mock import create_autospec
+
+import pytest
+from pyatcommand import AtErrorCode, AtResponse
+from pyatcommand.common import dprint
+
+from pynanomodem import SatelliteModem
+
+logger = logging.getLogger()
+
+
+# Simulation / mock support
+
+ResponseType = Union[AtResponse, Callable[[str, dict], AtResponse]]
+SubValue = str|Callable[[str, SatelliteModem], str]
+cmd_placeholders: dict[str, Union[str, Callable[[str, SatelliteModem], str]]] = {}
+
+def mock_res(info: Optional[str] = None, ok: bool = True):
+    """Returns an AT command response data structure for mocks."""
+    return AtResponse(AtErrorCode.OK if ok else AtErrorCode.ERROR, info)
+
+
+@pytest.fixture
+def mock_modem():
+    """Satellite Modem instance with send_command mocked."""
+    
+    def _make(response_map: dict[str, ResponseType],
+              background_commands: Optional[list[str]] = None,
+              delay_map: Optional[dict[str, float]] = None,
+              urc_map: Optional[dict[str, tuple[str, float]]] = None,
+              placeholders: Optional[dict[str, SubValue]] = None):
+        # Configure defaults
+        placeholders = cmd_placeholders if placeholders is None else placeholders
+        background_commands = background_commands or ['AT', 'ATE1', 'ATV1']
+        delay_map = delay_map or {}
+        urc_map = urc_map or {}
+        
+        modem = SatelliteModem(apn='viasat.poc')
+        modem._is_initialized = True
+        
+        substitutions = list(placeholders.items())
+        
+        def substitute(cmd: str,
+                       start: int = 0,
+                       resolve: bool = True,
+                       ) -> tuple[str, int]:
+            """Substitutes placeholders in commands for modem attributes.
+            
+            Placeholders are applied in order from `start`. If `resolve` is
+            False, stops before the first callable placeholder present.
+            
+            Returns:
+                The command and the index to resume from, or -1 if complete.
+            """
+            for i in range(start, len(substitutions)):
+                k, v = substitutions[i]
+                if k in cmd:
+                    if callable(v):
+                        if not resolve:
+                            return cmd, i
+                        cmd = v(cmd, modem)
+                    else:
+                        cmd = cmd.replace(k, v)
+            return cmd, -1
+        
+        def expand_map(command_map: dict[str, Any]) -> tuple:
+            """Pre-expands templates for lookup in map order.
+            
+            Templates fully resolved by static placeholders go in a dict of
+            (position, response). Templates needing a callable placeholder are
+            kept partially substituted in a list for per-command resolution.
+            """
+            lookup: dict[str, tuple[int, Any]] = {}
+            dynamic: list[tuple[int, str, int, Any]] = []
+            for pos, (template, response) in enumerate(command_map.items()):
+                partial, resume = substitute(template, resolve=False)
+                if resume < 0:
+                    lookup.setdefault(partial, (pos, response))
+                else:
+                    dynamic.append((pos, partial, resume, response))
+            return command_map, lookup, dynamic
+        
+        def find_in_map(incoming_cmd: str, expanded_map: tuple) -> Any|None:
+            """Looks up an AT command factoring placeholder substitutions"""
+            command_map, lookup, dynamic = expanded_map
+            if incoming_cmd in command_map:
+                return command_map[incoming_cmd]
+            static_pos, response = lookup.get(incoming_cmd,
+                                              (len(command_map), None))
+            # the first matching template in map order takes precedence
+            for pos, partial, resume, dynamic_response in dynamic:
+                if pos > static_pos:
+                    break
+                if substitute(partial, resume)[0] == incoming_cmd:
+                    return dynamic_response
+            return response
+        
+        expanded_responses = expand_map(response_map)
+        expanded_delays = expand_map(delay_map)
+        expanded_urcs = expand_map(urc_map)
+        
+        def emit_urc(urc: str, delay: float):
+            """Simulates a command-triggered unsolicited result after a delay."""
+            def _worker():
+                time.sleep(delay)
+                logger.info('Injecting URC %s', dprint(urc))
+                modem._unsolicited_queue.put(urc)
+            threading.Thread(target=_worker, daemon=True).start()
+        
+        def send_side_effect(cmd, **kwargs):
+            """Emulates a response to an AT command."""
+            delay_response = find_in_map(cmd, expanded_delays)
+            if delay_response is not None:
+                time.sleep(delay_response)
+            response = find_in_map(cmd, expanded_responses)
+            if response is not None:
+                if callable(response):
+                    return response(cmd, kwargs)
+                trigger_urc = find_in_map(cmd, expanded_urcs)
+                if trigger_urc is not None:
+                    emit_urc(*trigger_urc)
+                return response
+            elif cmd in background_commands:
+                return AtResponse(AtErrorCode.OK)
+            return AtResponse(AtErrorCode.ERROR)
+        
+        mocked_send = create_autospec(modem.send_command,
+                                      side_effect=send_side_effect)
+        modem.send_command = mocked_send
+        return modem
+    
+    return _make
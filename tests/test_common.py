@@ -0,0 +1,24 @@
+from pynanomodem import (
+    EventNotification,
+    EventNotificationIdp,
+    EventNotificationOgx,
+)
+from pynanomodem import common
+
+
+def test_get_events():
+    for cls in (EventNotificationIdp, EventNotificationOgx):
+        mask = 0
+        for i, member in enumerate(cls):
+            if i % 2 == 0:
+                mask |= member.value
+        expected = [m for m in cls if m & mask]
+        assert len(expected) > 0
+        assert cls.get_events(mask) == expected
+        assert cls.get_events(mask) == expected   # cached table
+    idp_bits = common._event_bits[EventNotificationIdp]
+    ogx_bits = common._event_bits[EventNotificationOgx]
+    assert idp_bits is not ogx_bits
+    assert all(isinstance(m, EventNotificationIdp) for _, m in idp_bits)
+    assert all(isinstance(m, EventNotificationOgx) for _, m in ogx_bits)
+    assert EventNotification.get_events(0xFFFF) == []
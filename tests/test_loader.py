@@ -1,8 +1,18 @@
 import os
+from types import SimpleNamespace
 
+import pytest
 import serial
 
-from pynanomodem import SatelliteModem, clone_and_load_modem_classes, mutate_modem
+from pynanomodem import (
+    ModemModel,
+    SatelliteModem,
+    clone_and_load_modem_classes,
+    loader,
+    mutate_modem,
+)
+
+from .conftest import mock_res
 
 
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
@@ -13,6 +23,54 @@ REPOS = [
     'pynanomodem-skywave-st2-idp',
 ]
 
+MOCK_PORT = '/dev/ttyMOCK'
+ST2_IDP_MAP = {
+    'ATI': mock_res('ORBCOMM'),
+    'ATI4': mock_res('ST2'),
+    'ATI5': mock_res('8'),
+}
+ST2_OGX_MAP = {
+    'ATI': mock_res('ORBCOMM'),
+    'ATI4': mock_res('ST2'),
+    'ATI5': mock_res('10'),
+}
+MODEL_CMDS = ('ATI', 'ATI4', 'ATI5')
+
+
+@pytest.fixture
+def modems_module(tmp_path, monkeypatch):
+    """Isolated modems folder with ST2 subclasses and empty caches."""
+    for model, name in ((ModemModel.ST2_IDP, 'MockSt2Idp'),
+                        (ModemModel.ST2_OGX, 'MockSt2Ogx')):
+        (tmp_path / f'mock_{model.name.lower()}.py').write_text(
+            'from pynanomodem import ModemModel, SatelliteModem\n'
+            '\n'
+            f'class {name}(SatelliteModem):\n'
+            f'    _model = ModemModel.{model.name}\n'
+        )
+    monkeypatch.setattr(loader, '_model_cache', {})
+    monkeypatch.setattr(loader, '_class_cache', {})
+    return SimpleNamespace(__path__=[str(tmp_path)])
+
+
+def mock_port_modem(mock_modem,
+                    response_map,
+                    connected: bool = True,
+                    ) -> SatelliteModem:
+    """Mock modem on a fixed serial port without a physical connection."""
+    modem: SatelliteModem = mock_modem(response_map)
+    modem._port = MOCK_PORT
+    modem.is_connected = lambda: connected
+    modem.connect = lambda **kwargs: None
+    modem.disconnect = lambda: None
+    return modem
+
+
+def model_queries(modem: SatelliteModem) -> list[str]:
+    """Model detection commands sent to a mocked modem."""
+    return [c.args[0] for c in modem.send_command.call_args_list             # type: ignore
+            if c.args[0] in MODEL_CMDS]
+
 
 def test_clone_and_load():
     if not GITHUB_TOKEN:
@@ -35,3 +93,46 @@ def test_detect_modem():
     assert modem.is_connected()
     assert modem.send_command('AT').ok
     assert isinstance(modem._serial, serial.Serial)
+
+
+def test_mutate_modem_caches_model(mock_modem, modems_module):
+    first = mock_port_modem(mock_modem, ST2_IDP_MAP)
+    first = mutate_modem(first, module=modems_module)
+    assert first._model == ModemModel.ST2_IDP
+    assert model_queries(first) == list(MODEL_CMDS)
+    second = mock_port_modem(mock_modem, ST2_IDP_MAP)
+    second = mutate_modem(second, module=modems_module)
+    assert second._model == ModemModel.ST2_IDP
+    assert type(second) is type(first)
+    assert model_queries(second) == []
+
+
+def test_mutate_modem_refresh(mock_modem, modems_module):
+    mutate_modem(mock_port_modem(mock_modem, ST2_IDP_MAP),
+                 module=modems_module)
+    modem = mock_port_modem(mock_modem, ST2_IDP_MAP)
+    modem = mutate_modem(modem, module=modems_module, refresh=True)
+    assert modem._model == ModemModel.ST2_IDP
+    assert model_queries(modem) == list(MODEL_CMDS)
+
+
+def test_mutate_modem_unknown_not_cached(mock_modem, modems_module):
+    unknown_map = {'ATI': mock_res('ACME')}
+    for _ in range(2):
+        modem = mock_port_modem(mock_modem, unknown_map)
+        with pytest.raises(ModuleNotFoundError):
+            mutate_modem(modem, module=modems_module)
+        assert model_queries(modem) == ['ATI']
+    assert MOCK_PORT not in loader._model_cache
+
+
+def test_mutate_modem_swapped_on_port(mock_modem, modems_module):
+    mutate_modem(mock_port_modem(mock_modem, ST2_IDP_MAP),
+                 module=modems_module)
+    assert loader._model_cache[MOCK_PORT] == ModemModel.ST2_IDP
+    # a different modem attached while disconnected is queried again
+    modem = mock_port_modem(mock_modem, ST2_OGX_MAP, connected=False)
+    modem = mutate_modem(modem, module=modems_module)
+    assert modem._model == ModemModel.ST2_OGX
+    assert model_queries(modem) == list(MODEL_CMDS)
+    assert loader._model_cache[MOCK_PORT] == ModemModel.ST2_OGX